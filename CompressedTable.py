@@ -0,0 +1,206 @@
+from array import array
+from collections.abc import ItemsView, Mapping
+
+_MISSING = object()
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    return (type(value), value)
+
+class _CellsView(ItemsView):
+    def __iter__(self):
+        return self._mapping._cells()
+
+class CompressedTable(Mapping):
+    # Read-only mapping over a sparse 2D table. Keys are (row, column) pairs,
+    # or (state, column, stack_symbol) triples as used by DPDA transitions,
+    # where (state, stack_symbol) is the row. Each row keeps its most
+    # frequent value as a default (e.g. the epsilon production spread over
+    # FOLLOW) together with a bitmask of the columns it covers; the other
+    # entries are packed into a single comb-vector with row displacement.
+    # Every row gets a distinct base, so the check array can hold bases.
+    def __init__(self, entries):
+        self.size = len(entries)
+        self.key_length = 2
+        self.rows = {}
+        self.column_keys = []
+        self.column_index = {}
+        self.values = []
+        self.masks = {}
+        self.defaults = {}
+
+        key_lengths = {len(key) if type(key) is tuple else None for key in entries}
+        if len(key_lengths) > 1 or not key_lengths <= {2, 3}:
+            raise ValueError("Keys must all be (row, column) pairs or (state, column, stack_symbol) triples!")
+        if key_lengths:
+            self.key_length = key_lengths.pop()
+
+        row_keys = {}
+        value_ids = {}
+        cells_by_row = []
+        for key, value in entries.items():
+            row_key, column_key = self._split_key(key)
+            if row_key not in row_keys:
+                row_keys[row_key] = len(cells_by_row)
+                cells_by_row.append({})
+            if column_key not in self.column_index:
+                self.column_index[column_key] = len(self.column_keys)
+                self.column_keys.append(column_key)
+
+            frozen = _freeze(value)
+            if frozen not in value_ids:
+                value_ids[frozen] = len(self.values)
+                self.values.append(value)
+            cells_by_row[row_keys[row_key]][self.column_index[column_key]] = value_ids[frozen]
+
+        defaults = []
+        explicit_rows = []
+        for cells in cells_by_row:
+            counts = {}
+            for value_id in cells.values():
+                counts[value_id] = counts.get(value_id, 0) + 1
+            default_id = max(counts, key=counts.get)
+
+            if counts[default_id] < 2:
+                defaults.append(None)
+                explicit_rows.append(cells)
+                continue
+
+            mask = 0
+            explicit = {}
+            for column, value_id in cells.items():
+                if value_id == default_id:
+                    mask |= 1 << column
+                else:
+                    explicit[column] = value_id
+            defaults.append((mask, self.values[default_id]))
+            explicit_rows.append(explicit)
+
+        bases, self.check, self.slots = self._pack_rows(explicit_rows)
+
+        for row_key, row in row_keys.items():
+            self.rows[row_key] = bases[row]
+            if defaults[row] is not None:
+                self.masks[bases[row]], self.defaults[bases[row]] = defaults[row]
+
+    def _pack_rows(self, explicit_rows):
+        bases = [None] * len(explicit_rows)
+        check = array('i')
+        slots = array('i')
+        # Bitsets over slot indices and over bases already handed out.
+        occupied = 0
+        used_bases = 0
+
+        for row in sorted(range(len(explicit_rows)), key=lambda r: -len(explicit_rows[r])):
+            columns = sorted(explicit_rows[row])
+            if not columns:
+                continue
+
+            # Bit b of candidates is set when every column of the row is free
+            # at base b; base len(check) always fits, so this never runs dry.
+            candidates = (1 << (len(check) + 1)) - 1
+            for column in columns:
+                candidates &= ~(occupied >> column)
+            candidates &= ~used_bases
+            base = (candidates & -candidates).bit_length() - 1
+
+            needed = base + columns[-1] + 1 - len(check)
+            if needed > 0:
+                check.extend([-1] * needed)
+                slots.extend([-1] * needed)
+
+            bases[row] = base
+            used_bases |= 1 << base
+            for column in columns:
+                occupied |= 1 << (base + column)
+                check[base + column] = base
+                slots[base + column] = explicit_rows[row][column]
+
+        # Rows that only hold a default still need a base no other row uses.
+        free_base = 0
+        for row, base in enumerate(bases):
+            if base is None:
+                while used_bases >> free_base & 1:
+                    free_base += 1
+                bases[row] = free_base
+                used_bases |= 1 << free_base
+
+        # Pad so that base + column never runs past the end of the arrays.
+        padding = max(bases, default=0) + len(self.column_keys) - len(check)
+        if padding > 0:
+            check.extend([-1] * padding)
+            slots.extend([-1] * padding)
+
+        return bases, check, slots
+
+    def _split_key(self, key):
+        if self.key_length == 2:
+            return key
+        state, column_key, stack_symbol = key
+        return (state, stack_symbol), column_key
+
+    def _join_key(self, row_key, column_key):
+        if self.key_length == 2:
+            return (row_key, column_key)
+        return (row_key[0], column_key, row_key[1])
+
+    def get(self, key, default=None):
+        if type(key) is not tuple or len(key) != self.key_length:
+            return default
+        if self.key_length == 2:
+            row_key, column_key = key
+        else:
+            state, column_key, stack_symbol = key
+            row_key = (state, stack_symbol)
+
+        base = self.rows.get(row_key)
+        column = self.column_index.get(column_key)
+        if base is None or column is None:
+            return default
+
+        index = base + column
+        if self.check[index] == base:
+            return self.values[self.slots[index]]
+        if self.masks.get(base, 0) >> column & 1:
+            return self.defaults[base]
+        return default
+
+    def _cells(self):
+        explicit_cells = {}
+        for index, base in enumerate(self.check):
+            if base != -1:
+                explicit_cells.setdefault(base, []).append((index - base, self.values[self.slots[index]]))
+
+        for row_key, base in self.rows.items():
+            cells = explicit_cells.get(base, [])
+            mask = self.masks.get(base, 0)
+            while mask:
+                lowest = mask & -mask
+                cells.append((lowest.bit_length() - 1, self.defaults[base]))
+                mask ^= lowest
+
+            for column, value in sorted(cells, key=lambda cell: cell[0]):
+                yield self._join_key(row_key, self.column_keys[column]), value
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __iter__(self):
+        for key, _ in self._cells():
+            yield key
+
+    def items(self):
+        return _CellsView(self)
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return f"CompressedTable({dict(self.items())})"
@@ -71,18 +71,18 @@ class DPDA:
     def _find_transition(self, current_state, current_input_symbol_on_tape, stack_top):
         
         if current_input_symbol_on_tape is not None:
-            key = (current_state, current_input_symbol_on_tape, stack_top)
-            if key in self.transition_function:
-                next_state, push_symbols = self.transition_function[key]
+            transition = self.transition_function.get((current_state, current_input_symbol_on_tape, stack_top))
+            if transition is not None:
+                next_state, push_symbols = transition
 
                 if not push_symbols and stack_top == current_input_symbol_on_tape : 
                     return "MATCH_CONSUME", next_state, push_symbols
                 else: 
                     return "EXPAND_NO_CONSUME", next_state, push_symbols
 
-        key_epsilon_move = (current_state, self.epsilon_symbol, stack_top)
-        if key_epsilon_move in self.transition_function:
-            next_state, push_symbols = self.transition_function[key_epsilon_move]
+        transition = self.transition_function.get((current_state, self.epsilon_symbol, stack_top))
+        if transition is not None:
+            next_state, push_symbols = transition
             return "EPSILON_NO_CONSUME", next_state, push_symbols
             
         return "NO_TRANSITION", None, None
@@ -1,13 +1,15 @@
 # In the name of Allah
 from DPDA import DPDA
+from CompressedTable import CompressedTable
 
 class LL1_2_DPDA:
-    def __init__(self, grammar, initial_stack_symbol='Z0'):
+    def __init__(self, grammar, initial_stack_symbol='Z0', compress_tables=False):
         self.first = {}
         self.follow = {}
         self.parsing_table = {}
         self.grammar = grammar
         self.initial_stack_symbol = initial_stack_symbol
+        self.compress_tables = compress_tables
         self.dpda = None
 
         self._convert_ll1_to_dpda()
@@ -144,6 +146,9 @@ class LL1_2_DPDA:
                     for terminal_b in self.follow.get(non_terminal_A, set()):
                         self.parsing_table[(non_terminal_A, terminal_b)] = production_rule_alpha
 
+        if self.compress_tables:
+            self.parsing_table = CompressedTable(self.parsing_table)
+
     def _convert_ll1_to_dpda(self):
         self._build_parsing_table()
         
@@ -172,6 +177,8 @@ class LL1_2_DPDA:
             transition_function[key] = ('q', [])
         
         transition_function[('q', epsilon_symbol_for_dpda, self.initial_stack_symbol)] = ('f', [])
+        if self.compress_tables:
+            transition_function = CompressedTable(transition_function)
 
         self.dpda = DPDA(
             all_states=states,
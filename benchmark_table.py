@@ -0,0 +1,88 @@
+# In the name of Allah
+import random
+import sys
+import time
+import timeit
+
+from CompressedTable import CompressedTable
+from Grammar import Grammar
+from LL1ToDPDA import LL1_2_DPDA
+
+def generate_grammar(num_non_terminals, num_terminals, leads_per_row=None, epsilon_rate=0.6, seed=0):
+    rng = random.Random(seed)
+    grammar = Grammar()
+    non_terminals = [f"N{i}" for i in range(num_non_terminals)]
+    terminals = [f"t{i}" for i in range(num_terminals)]
+
+    grammar.start_symbol = non_terminals[0]
+    grammar.non_terminals = set(non_terminals)
+    grammar.terminals = set(terminals)
+
+    for non_terminal in non_terminals:
+        num_leads = leads_per_row or rng.randint(1, min(4, num_terminals))
+        leads = rng.sample(terminals, num_leads)
+        grammar.productions[non_terminal] = [
+            [lead] + rng.sample(non_terminals, rng.randint(0, 2)) for lead in leads
+        ]
+        if rng.random() < epsilon_rate:
+            grammar.productions[non_terminal].append([grammar.epsilon_symbol])
+
+    return grammar
+
+def table_size(table):
+    if isinstance(table, dict):
+        size = sys.getsizeof(table)
+        for key, value in table.items():
+            size += sys.getsizeof(key)
+            if isinstance(value, tuple):
+                size += sys.getsizeof(value)
+        return size
+
+    size = sys.getsizeof(table)
+    for part in (table.rows, table.column_keys, table.column_index, table.values,
+                 table.masks, table.defaults, table.check, table.slots):
+        size += sys.getsizeof(part)
+    size += sum(sys.getsizeof(row_key) for row_key in table.rows if isinstance(row_key, tuple))
+    size += sum(sys.getsizeof(mask) for mask in table.masks.values())
+    size += sum(sys.getsizeof(value) for value in table.values if isinstance(value, tuple))
+    return size
+
+def time_lookups(table, keys, repeat=5):
+    lookup = table.get
+    return min(timeit.repeat(lambda: [lookup(key) for key in keys], number=1, repeat=repeat))
+
+def compare(name, dense, keys):
+    start = time.perf_counter()
+    compressed = CompressedTable(dense)
+    build_time = time.perf_counter() - start
+    assert dict(compressed.items()) == dense
+    assert all(dense.get(key) == compressed.get(key) for key in keys)
+
+    dense_size, compressed_size = table_size(dense), table_size(compressed)
+    dense_time, compressed_time = time_lookups(dense, keys), time_lookups(compressed, keys)
+    print(f"  {name:<20} entries={len(dense):<7} build={build_time * 1e3:8.1f} ms  "
+          f"size: {dense_size:>9} -> {compressed_size:>9} bytes ({compressed_size / dense_size:.2f}x)  "
+          f"lookup: {dense_time * 1e9 / len(keys):6.0f} -> {compressed_time * 1e9 / len(keys):6.0f} ns")
+
+def main():
+    cases = (
+        ("FOLLOW-dominated", {}, ((10, 10), (100, 100), (300, 300), (500, 200))),
+        ("distinct cells", {"leads_per_row": 20, "epsilon_rate": 0}, ((200, 200), (400, 400), (800, 400))),
+        ("distinct cells", {"leads_per_row": 40, "epsilon_rate": 0}, ((400, 400),)),
+    )
+    for title, options, sizes in cases:
+        for num_non_terminals, num_terminals in sizes:
+            grammar = generate_grammar(num_non_terminals, num_terminals, **options)
+            L2D = LL1_2_DPDA(grammar)
+
+            columns = sorted(grammar.terminals) + [grammar.epsilon_symbol]
+            table_keys = [(nt, t) for nt in sorted(grammar.non_terminals) for t in columns]
+            stack_symbols = sorted(L2D.dpda.stack_alphabet)
+            transition_keys = [('q', t, s) for s in stack_symbols for t in columns]
+
+            print(f"\n{title}: {num_non_terminals} non-terminals, {num_terminals} terminals, {options or 'defaults'}")
+            compare("parsing_table", L2D.parsing_table, table_keys)
+            compare("transition_function", L2D.dpda.transition_function, transition_keys)
+
+if __name__ == "__main__":
+    main()